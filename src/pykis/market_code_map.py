@@ -42,20 +42,20 @@ class MarketCodeMap:
         self.codes_3 = list(self.map_3_to_4.keys())
         self.codes_4 = list(self.map_3_to_4.values())
 
+        # 3글자/4글자 코드를 모두 key로 갖는 변환 테이블
+        self.map_any_to_4 = {
+            **self.map_3_to_4, **{code: code for code in self.codes_4}
+        }
+        self.map_any_to_3 = {
+            **self.map_4_to_3, **{code: code for code in self.codes_3}
+        }
+
     def _convert(self, market_code: str, is_3_to4: bool) -> str:
         """
         거래소 코드 변환용 내부 함수
         """
         market_code = market_code.upper()
-
-        if is_3_to4:
-            if market_code in self.map_4_to_3:
-                return market_code
-            convert_map = self.map_3_to_4
-        else:
-            if market_code in self.map_3_to_4:
-                return market_code
-            convert_map = self.map_4_to_3
+        convert_map = self.map_any_to_4 if is_3_to4 else self.map_any_to_3
 
         if market_code in convert_map:
             return convert_map[market_code]
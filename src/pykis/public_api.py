@@ -16,20 +16,245 @@ pykist 패키지의 public api 모음
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import NamedTuple, Optional, Tuple
-import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+import functools
+import threading
 import pandas as pd
 import datetime
+import requests
+from requests.adapters import HTTPAdapter
 
 from .oversea_info import Market, get_country_by_market_code
-from .request_utility import *  # pylint: disable = wildcard-import, unused-wildcard-import
+from .request_utility import Json, APIRequestParameter, APIResponse, \
+    get_base_headers, send_get_request, send_post_request
 from .domain_info import DomainInfo
 from .access_token import AccessToken
-from .utility import *  # pylint: disable = wildcard-import, unused-wildcard-import
+from .utility import MAX_WORKERS, RateLimiter, TTLCache, \
+    get_continuous_query_code, get_currency_code_from_market_code, \
+    get_order_inquiry_period, get_order_tr_id_from_market_code, coerce_numeric, \
+    map_concurrently, select_and_rename, send_continuous_query, to_arrow_backed, \
+    to_namedtuple
 from .market_code_map import MarketCodeMap
 
 
-DELAY = 0.2
+# KIS Developers REST API의 초당 호출 제한 (실전/모의)
+REAL_REQUESTS_PER_SEC = 20
+VIRTUAL_REQUESTS_PER_SEC = 5
+
+# 여러 주문을 일괄 정정/취소할 때 동시에 처리할 최대 주문 수
+ORDER_MAX_WORKERS = 5
+
+# 해외 주식 거래소 코드 목록
+_ALL_MARKETS: Tuple[str, ...] = tuple(Market.get_all())
+
+# 미체결 주문 조회에서 제외할 거래소 코드 (NASD 조회 결과에 미국 전체가 포함된다)
+_EXCLUDED_OS_CODES = frozenset({"AMEX", "NYSE"})
+
+# 연속 조회 파라미터의 초기값 (key: is_kr)
+_EMPTY_CTX_AREA_PARAMS = {
+    is_kr: {
+        f"CTX_AREA_FK{get_continuous_query_code(is_kr)}": "",
+        f"CTX_AREA_NK{get_continuous_query_code(is_kr)}": "",
+    }
+    for is_kr in (True, False)
+}
+
+# 기간 분류 코드 별칭 (d/day-일, w/week-주, m/month-월)
+_TIME_UNIT_MAP = {
+    "DAYS": "D",
+    "DAY": "D",
+    "WEEKS": "W",
+    "WEEK": "W",
+    "MONTHS": "M",
+    "MONTH": "M",
+}
+
+# 해외 주식 정정/취소 tr_id. key: (실전 투자 여부, 국가)
+_OS_REVISE_CANCEL_TR_IDS = {
+    (True, "USA"): "TTTT1004U",
+    (True, "HK"): "TTTS1003U",
+    (True, "JP"): "TTTS0309U",
+    (True, "CN_SHA"): "TTTS0302U",
+    (True, "CN_SZX"): "TTTS0306U",
+    (True, "VN"): "TTTS0312U",
+    (False, "USA"): "VTTT1004U",
+    (False, "HK"): "VTTS1003U",
+    (False, "JP"): "VTTS0309U",
+    (False, "CN_SHA"): "VTTS0302U",
+    (False, "CN_SZX"): "VTTS0306U",
+    (False, "VN"): "VTTS0312U",
+}
+
+# 매도매수구분코드 (01: 매도, 02: 매수)
+_SELL_BUY_MAP = {"01": "매도", "02": "매수"}
+_SELL_BUY_CODES = {value: key for key, value in _SELL_BUY_MAP.items()}
+# page마다 category가 달라지면 concat 후 object로 돌아가므로 category를 고정한다
+_SELL_BUY_DTYPE = pd.CategoricalDtype(list(_SELL_BUY_MAP.values()))
+
+# 국내 주식 OHLCV 컬럼
+_OHLCV_RENAME = {
+    "stck_bsop_date": "Date",
+    "stck_oprc": "Open",
+    "stck_hgpr": "High",
+    "stck_lwpr": "Low",
+    "stck_clpr": "Close",
+    "acml_vol": "Volume",
+}
+_OHLCV_COLUMNS = list(_OHLCV_RENAME)
+_OHLCV_PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# 국내 주식 잔고 컬럼
+_KR_BALANCE_RENAME = {
+    "prdt_name": "종목명",
+    "hldg_qty": "보유수량",
+    "ord_psbl_qty": "매도가능수량",
+    "pchs_avg_pric": "매입단가",
+    "evlu_pfls_rt": "수익율",
+    "prpr": "현재가",
+    "bfdy_cprs_icdc": "전일대비",
+    "fltt_rt": "등락",
+}
+_KR_BALANCE_COLUMNS = list(_KR_BALANCE_RENAME)
+_KR_BALANCE_DTYPES = {
+    "hldg_qty": "int64",
+    "ord_psbl_qty": "int64",
+    "pchs_avg_pric": "float64",
+    "evlu_pfls_rt": "float64",
+    "prpr": "int64",
+    "bfdy_cprs_icdc": "int64",
+    "fltt_rt": "float64",
+}
+
+# 해외 주식 잔고 컬럼
+_OS_BALANCE_RENAME = {
+    "ovrs_item_name": "종목명",
+    "ovrs_cblc_qty": "보유수량",
+    "ord_psbl_qty": "매도가능수량",
+    "frcr_pchs_amt1": "매입단가",
+    "evlu_pfls_rt": "수익율",
+    "now_pric2": "현재가",
+    "ovrs_excg_cd": "거래소코드",
+    "tr_crcy_cd": "거래화폐코드",
+}
+_OS_BALANCE_COLUMNS = list(_OS_BALANCE_RENAME)
+_OS_BALANCE_NUMERIC_COLUMNS = [
+    "ovrs_cblc_qty", "ord_psbl_qty", "frcr_pchs_amt1", "evlu_pfls_rt", "now_pric2",
+]
+
+# 해외 주식 주문 내역 컬럼
+_OS_ORDER_HISTORY_RENAME = {
+    "ord_dt": "주문일자",
+    "ord_gno_brno": "주문채번지점번호",
+    "odno": "주문번호",
+    "orgn_odno": "원주문번호",
+    "sll_buy_dvsn_cd": "매도매수구분코드",
+    "sll_buy_dvsn_cd_name": "매도매수구분코드명",
+    "rvse_cncl_dvsn": "정정취소구분",
+    "rvse_cncl_dvsn_name": "정정취소구분명",
+    "pdno": "상품번호",
+    "prdt_name": "상품명",
+    "ft_ord_qty": "FT주문수량",
+    "ft_ord_unpr3": "FT주문단가3",
+    "ft_ccld_qty": "FT체결수량",
+    "ft_ccld_unpr3": "FT체결단가3",
+    "ft_ccld_amt3": "FT체결금액3",
+    "nccs_qty": "미체결수량",
+    "prcs_stat_name": "처리상태명",
+    "rjct_rson": "거부사유",
+    "ord_tmd": "주문시각",
+    "tr_mket_name": "거래시장명",
+    "tr_natn": "거래국가",
+    "tr_natn_name": "거래국가명",
+    "ovrs_excg_cd": "해외거래소코드",
+    "tr_crcy_cd": "거래통화코드",
+    "dmst_ord_dt": "국내주문일자",
+    "thco_ord_tmd": "당사주문시각",
+    "loan_type_cd": "대출유형코드",
+    "mdia_dvsn_name": "매체구분명",
+    "loan_dt": "대출일자",
+    "rjct_rson_name": "거부사유명",
+    "usa_amk_exts_rqst_yn": "미국애프터마켓연장신청여부",
+}
+
+# 국내 주식 주문 내역 컬럼
+_KR_ORDER_HISTORY_RENAME = {
+    "ord_dt": "주문일자",
+    "ord_gno_brno": "주문채번지점번호",
+    "odno": "주문번호",
+    "orgn_odno": "원주문번호",
+    "ord_dvsn_name": "주문구분명",
+    "sll_buy_dvsn_cd": "매도매수구분코드",
+    "sll_buy_dvsn_cd_name": "매도매수구분코드명",
+    "pdno": "상품번호",
+    "prdt_name": "상품명",
+    "ord_qty": "주문수량",
+    "ord_unpr": "주문단가",
+    "ord_tmd": "주문시각",
+    "tot_ccld_qty": "총체결수량",
+    "avg_prvs": "평균가",
+    "cncl_yn": "취소여부",
+    "tot_ccld_amt": "총체결금액",
+    "loan_dt": "대출일자",
+    "ord_dvsn_cd": "주문구분코드",
+    "cncl_cfrm_qty": "취소확인수량",
+    "rmn_qty": "잔여수량",
+    "rjct_qty": "거부수량",
+    "ccld_cndt_name": "체결조건명",
+    "infm_tmd": "통보시각",
+    "ctac_tlno": "연락전화번호",
+    "prdt_type_cd": "상품유형코드",
+    "excg_dvsn_cd": "거래소구분코드",
+}
+_KR_ORDER_HISTORY_COLUMNS = list(_KR_ORDER_HISTORY_RENAME)
+
+# 취소/정정 가능한 국내 주식 주문 컬럼
+_KR_ORDERS_RENAME = {
+    "pdno": "종목코드",
+    "ord_qty": "주문수량",
+    "psbl_qty": "정정취소가능수량",
+    "ord_unpr": "주문가격",
+    "sll_buy_dvsn_cd": "매수매도구분",
+    "ord_tmd": "시간",
+    "ord_gno_brno": "주문점",
+    "orgn_odno": "원번호",
+}
+_KR_ORDERS_COLUMNS = list(_KR_ORDERS_RENAME)
+_KR_ORDERS_DTYPES = {
+    "ord_qty": "Int64",
+    "psbl_qty": "Int64",
+    "ord_unpr": "Int64",
+}
+
+# 미체결 해외 주식 주문 컬럼
+_OS_ORDERS_RENAME = {
+    "pdno": "종목코드",
+    "ft_ord_qty": "주문수량",
+    "ft_ccld_qty": "체결수량",
+    "nccs_qty": "미체결수량",
+    "ft_ord_unpr3": "주문가격",
+    "sll_buy_dvsn_cd": "매수매도구분",
+    "ord_tmd": "시간",
+    "ord_gno_brno": "주문점",
+    "orgn_odno": "원번호",
+    "ovrs_excg_cd": "해외거래소코드",
+    "tr_crcy_cd": "거래통화코드",
+    "prcs_stat_name": "처리상태명",
+    "rjct_rson_name": "거부사유명",
+    "rjct_rson": "거부사유",
+}
+_OS_ORDERS_COLUMNS = list(_OS_ORDERS_RENAME)
+_OS_ORDERS_DTYPES = {
+    "ft_ord_qty": "Int64",
+    "ft_ccld_qty": "Int64",
+    "nccs_qty": "Int64",
+    "ft_ord_unpr3": "float64",
+}
+# 값의 종류가 고정되어 있지 않으므로 모든 거래소의 결과를 합친 뒤에 category로 변환한다
+_OS_ORDERS_CATEGORIES = {
+    "해외거래소코드": "category",
+    "거래통화코드": "category",
+}
+
 
 class Api:  # pylint: disable=too-many-public-methods
     """
@@ -37,21 +262,47 @@ class Api:  # pylint: disable=too-many-public-methods
     """
 
     def __init__(self, key_info: Json, domain_info: DomainInfo = DomainInfo(kind="real"),
-                 account_info: Optional[Json] = None) -> None:
+                 account_info: Optional[Json] = None, price_ttl: float = 0.5) -> None:
         """
         key_info: API 사용을 위한 인증키 정보. appkey, appsecret
         domain_info: domain 정보 (실전/모의/etc)
         account_info: 사용할 계좌 정보.
                     { "account_code" : "[계좌번호 앞 8자리 숫자]", "product_code" : "[계좌번호 뒤 2자리 숫자]" }
+        price_ttl: 현재가 시세 정보를 재사용할 시간 (단위: 초). 0 이하인 경우 매번 새로 조회한다.
         """
         self.key: Json = key_info
         self.domain: DomainInfo = domain_info
         self.token: AccessToken = AccessToken()
         self.account: Optional[NamedTuple] = None
+        self._account_params: Dict[str, str] = {}
+
+        requests_per_sec = REAL_REQUESTS_PER_SEC if self.domain.is_real() \
+            else VIRTUAL_REQUESTS_PER_SEC
+        self.rate_limiter: RateLimiter = RateLimiter(requests_per_sec)
+        self._token_lock = threading.Lock()
+
+        # keep-alive로 connection을 재사용하기 위해 하나의 session을 공유한다
+        self.session: requests.Session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4,
+                                                   pool_maxsize=MAX_WORKERS))
+        self._price_cache: TTLCache = TTLCache(price_ttl)
+
+        # 모든 request에 공통으로 들어가는 header
+        self._static_headers: Json = {
+            **get_base_headers(),
+            **self.get_api_key_data(),
+        }
 
         self.set_account(account_info)
         self.market_code_map = MarketCodeMap()
 
+        # 해외 주식 매매 tr_id 테이블. key: (거래소 코드, 매수 여부)
+        self._is_real: bool = self.domain.is_real()
+        self._os_order_tr_ids: Dict[Tuple[str, bool], str] = {
+            (market_code, buy): get_order_tr_id_from_market_code(market_code, buy, self._is_real)
+            for market_code in _ALL_MARKETS for buy in (True, False)
+        }
+
     def set_account(self, account_info: Optional[Json]) -> None:
         """
         사용할 계좌 정보를 설정한다.
@@ -60,6 +311,10 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         if account_info is not None:
             self.account = to_namedtuple("account", account_info)
+            self._account_params = {
+                "CANO": self.account.account_code,
+                "ACNT_PRDT_CD": self.account.product_code,
+            }
 
     # 인증-----------------
 
@@ -69,12 +324,10 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         url_path = "/oauth2/tokenP"
 
-        params = merge_json([
-            self.get_api_key_data(),
-            {
-                "grant_type": "client_credentials"
-            }
-        ])
+        params = {
+            **self.get_api_key_data(),
+            "grant_type": "client_credentials"
+        }
 
         req = APIRequestParameter(url_path, tr_id=None,
                                   params=params, requires_authentication=False, requires_hash=False)
@@ -127,6 +380,17 @@ class Api:  # pylint: disable=too-many-public-methods
 
         return int(price)
 
+    def get_kr_current_prices(self, tickers: Iterable[str]) -> Dict[str, int]:
+        """
+        여러 국내 주식의 현재가를 동시에 조회하여 반환한다.
+        tickers: 종목코드 목록
+        return: {종목코드: 현재가 (단위: 원)}
+        """
+        tickers = list(dict.fromkeys(tickers))
+        infos = map_concurrently(self._get_kr_stock_current_price_info, tickers)
+
+        return {ticker: int(info["stck_prpr"]) for ticker, info in zip(tickers, infos)}
+
     def get_kr_max_price(self, ticker: str) -> int:
         """
         국내 주식의 상한가를 반환한다.
@@ -155,6 +419,10 @@ class Api:  # pylint: disable=too-many-public-methods
         ticker: 종목코드
         return: 해당 종목 현재 시세 정보
         """
+        cached = self._price_cache.get(("kr", ticker))
+        if cached is not None:
+            return cached
+
         url_path = "/uapi/domestic-stock/v1/quotations/inquire-price"
 
         tr_id = "FHKST01010100"
@@ -166,7 +434,9 @@ class Api:  # pylint: disable=too-many-public-methods
 
         req = APIRequestParameter(url_path, tr_id, params)
         res = self._send_get_request(req)
-        return res.outputs[0]
+        info = res.outputs[0]
+        self._price_cache.set(("kr", ticker), info)
+        return info
 
     def _get_kr_history(self, ticker: str, time_unit: str = "D") -> APIResponse:
         """
@@ -175,13 +445,7 @@ class Api:  # pylint: disable=too-many-public-methods
         time_unit: 기간 분류 코드 (d/day-일, w/week-주, m/month-월)
         """
         time_unit = time_unit.upper()
-
-        if time_unit in ["DAYS", "DAY"]:
-            time_unit = "D"
-        elif time_unit in ["WEEKS", "WEEK"]:
-            time_unit = "W"
-        elif time_unit in ["MONTHS", "MONTH"]:
-            time_unit = "M"
+        time_unit = _TIME_UNIT_MAP.get(time_unit, time_unit)
 
         url_path = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
         tr_id = "FHKST01010400"
@@ -208,22 +472,11 @@ class Api:  # pylint: disable=too-many-public-methods
         if not res.is_ok() or len(res.outputs) == 0 or len(res.outputs[0]) == 0:
             return pd.DataFrame()
 
-        date_column = ["Date"]
-        other_colums = ["Open", "High", "Low", "Close", "Volume"]
-
-        keys = ["stck_bsop_date", "stck_oprc",
-                "stck_hgpr", "stck_lwpr", "stck_clpr", "acml_vol"]
-        values = date_column + other_colums
-
-        data = pd.DataFrame(res.outputs[0])
+        data = pd.DataFrame.from_records(res.outputs[0], columns=_OHLCV_COLUMNS)
+        data.rename(columns=_OHLCV_RENAME, inplace=True)
 
-        data = data[keys]
-        rename_map = dict(zip(keys, values))
-
-        data.rename(columns=rename_map, inplace=True)
-
-        data[date_column] = data[date_column].apply(pd.to_datetime)
-        data[other_colums] = data[other_colums].apply(pd.to_numeric)
+        data["Date"] = pd.to_datetime(data["Date"], format="%Y%m%d")
+        data[_OHLCV_PRICE_COLUMNS] = data[_OHLCV_PRICE_COLUMNS].astype("int64")
         data.set_index("Date", inplace=True)
 
         return data
@@ -241,6 +494,10 @@ class Api:  # pylint: disable=too-many-public-methods
         ticker = ticker.upper()
         market_code = market_code.upper()
 
+        cached = self._price_cache.get(("os", ticker, market_code))
+        if cached is not None:
+            return cached
+
         params = {
             "AUTH": "",
             "EXCD": market_code,
@@ -249,7 +506,9 @@ class Api:  # pylint: disable=too-many-public-methods
 
         req = APIRequestParameter(url_path, tr_id, params)
         res = self._send_get_request(req)
-        return res.outputs[0]
+        info = res.outputs[0]
+        self._price_cache.set(("os", ticker, market_code), info)
+        return info
 
     def get_os_current_price(self, ticker: str, market_code: str) -> float:
         """
@@ -282,8 +541,7 @@ class Api:  # pylint: disable=too-many-public-methods
         qry_price = 0
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
+            **self._account_params,
             "PDNO": stock_code,
             "ORD_UNPR": str(qry_price),
             "ORD_DVSN": "02",
@@ -303,19 +561,15 @@ class Api:  # pylint: disable=too-many-public-methods
         """
 
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            tdf = pd.DataFrame(res.outputs[0])
+            tdf = pd.DataFrame.from_records(res.outputs[0],
+                                            columns=["pdno"] + _KR_BALANCE_COLUMNS)
             if tdf.empty:
-                return tdf
+                return pd.DataFrame()
 
             tdf.set_index("pdno", inplace=True)
-            tdf = tdf.replace('nan', 0)
-            cf1 = ["prdt_name", "hldg_qty", "ord_psbl_qty", "pchs_avg_pric",
-                   "evlu_pfls_rt", "prpr", "bfdy_cprs_icdc", "fltt_rt"]
-            cf2 = ["종목명", "보유수량", "매도가능수량", "매입단가", "수익율", "현재가", "전일대비", "등락"]
-            tdf = tdf[cf1]
-            tdf[cf1[1:]] = tdf[cf1[1:]].apply(pd.to_numeric)
-            ren_dict = dict(zip(cf1, cf2))
-            return tdf.rename(columns=ren_dict)
+            tdf = tdf.replace('nan', 0).astype(_KR_BALANCE_DTYPES)
+            tdf.rename(columns=_KR_BALANCE_RENAME, inplace=True)
+            return tdf
 
         def request_function(*args, **kwargs):
             return self._get_kr_total_balance(*args, **kwargs)
@@ -385,11 +639,10 @@ class Api:  # pylint: disable=too-many-public-methods
         해외 주식 잔고를 DataFrame으로 반환한다
         return: 미국 주식 잔고 정보를 DataFrame으로 반환
         """
-        market_codes = Market.get_all()
-        datas = [self._get_os_stock_balance(market_code)
-                 for market_code in market_codes]
+        datas = map_concurrently(self._get_os_stock_balance, _ALL_MARKETS)
+        data = pd.concat(datas) if len(datas) > 1 else datas[0]
 
-        return pd.concat(datas).drop_duplicates()
+        return data.drop_duplicates()
 
     def _get_os_stock_balance(self, market_code: str) -> pd.DataFrame:
         """
@@ -398,19 +651,16 @@ class Api:  # pylint: disable=too-many-public-methods
         """
 
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            tdf = pd.DataFrame(res.outputs[0])
+            tdf = pd.DataFrame.from_records(res.outputs[0],
+                                            columns=["ovrs_pdno"] + _OS_BALANCE_COLUMNS)
             if tdf.empty:
-                return tdf
+                return pd.DataFrame()
 
             tdf.set_index("ovrs_pdno", inplace=True)
-            cf1 = ["ovrs_item_name", "ovrs_cblc_qty", "ord_psbl_qty", "frcr_pchs_amt1",
-                   "evlu_pfls_rt", "now_pric2", "ovrs_excg_cd", "tr_crcy_cd"]
-            cf2 = ["종목명", "보유수량", "매도가능수량", "매입단가",
-                   "수익율", "현재가", "거래소코드", "거래화폐코드"]
-            tdf = tdf[cf1]
-            tdf[cf1[1:-2]] = tdf[cf1[1:-2]].apply(pd.to_numeric)
-            ren_dict = dict(zip(cf1, cf2))
-            return tdf.rename(columns=ren_dict)
+            tdf[_OS_BALANCE_NUMERIC_COLUMNS] = \
+                tdf[_OS_BALANCE_NUMERIC_COLUMNS].astype("float64")
+            tdf.rename(columns=_OS_BALANCE_RENAME, inplace=True)
+            return tdf
 
         def request_function(*args, **kwargs):
             return self._get_os_total_balance(market_code, *args, **kwargs)
@@ -430,20 +680,15 @@ class Api:  # pylint: disable=too-many-public-methods
             url_path = "/uapi/overseas-stock/v1/trading/inquire-balance"
             tr_id = "JTTT3012R"
 
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
-
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(is_kr)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
-            f"CTX_AREA_FK{query_code}": "",
-            f"CTX_AREA_NK{query_code}": ""
+            **self._account_params,
+            **_EMPTY_CTX_AREA_PARAMS[is_kr],
+            **extra_param,
         }
 
-        params = merge_json([params, extra_param])
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         return self._send_get_request(req)
@@ -453,13 +698,13 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         해외 주식 잔고의 조회 전체 결과를 반환한다.
         """
-        time.sleep(DELAY)
         currency_code = get_currency_code_from_market_code(market_code)
 
-        extra_param = merge_json([{
+        extra_param = {
             "OVRS_EXCG_CD": market_code,
             "TR_CRCY_CD": currency_code,
-        }, none_to_empty_dict(extra_param)])
+            **(extra_param or {}),
+        }
 
         is_kr = False
 
@@ -470,7 +715,7 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         국내 주식 잔고의 조회 전체 결과를 반환한다.
         """
-        extra_param = merge_json([{
+        extra_param = {
             "AFHR_FLPR_YN": "N",
             "FNCG_AMT_AUTO_RDPT_YN": "N",
             "FUND_STTL_ICLD_YN": "N",
@@ -478,26 +723,31 @@ class Api:  # pylint: disable=too-many-public-methods
             "OFL_YN": "N",
             "PRCS_DVSN": "01",
             "UNPR_DVSN": "01",
-        }, none_to_empty_dict(extra_param)])
+            **(extra_param or {}),
+        }
 
         is_kr = True
 
         return self._get_total_balance(is_kr, extra_header, extra_param)
 
     def _get_os_inquire_psamount(self, extra_header: Json = None,
-                                 extra_param: Json = None) -> APIResponse:
+                                 extra_param: Json = None) -> pd.DataFrame:
         """
-        해외 주식 잔고의 주문 가능 예수금을 반환한다. TODO 기능작성중
+        해외 주식 잔고의 거래소별 주문 가능 예수금을 DataFrame으로 반환한다. TODO 기능작성중
         """
         is_kr = False
-        market_codes = Market.get_all()
-        for market_code in market_codes:
-            extra_param = merge_json([{
+
+        def request_function(market_code: str) -> APIResponse:
+            market_param = {
+                **(extra_param or {}),
                 "OVRS_EXCG_CD": market_code,
-            }, none_to_empty_dict(extra_param)])
-            datas = self._get_inquire_psamount(is_kr, extra_header, extra_param)
+            }
+            return self._get_inquire_psamount(is_kr, extra_header, market_param)
+
+        responses = map_concurrently(request_function, _ALL_MARKETS)
+        outputs = [res.body["output"] for res in responses]
 
-        return pd.concat(datas).drop_duplicates()
+        return pd.DataFrame(outputs, index=list(_ALL_MARKETS))
 
     def _get_inquire_psamount(self, is_kr: bool,
                               extra_header: Json = None,
@@ -514,23 +764,19 @@ class Api:  # pylint: disable=too-many-public-methods
             extra_param = {
                 "OVRS_EXCG_CD":"NASD",
                 "OVRS_ORD_UNPR":"0",
-                "ITEM_CD":"NDAQ"
+                "ITEM_CD":"NDAQ",
+                **(extra_param or {}),
             }
 
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
-
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(is_kr)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
-            f"CTX_AREA_FK{query_code}": "",
-            f"CTX_AREA_NK{query_code}": ""
+            **self._account_params,
+            **_EMPTY_CTX_AREA_PARAMS[is_kr],
+            **extra_param,
         }
 
-        params = merge_json([params, extra_param])
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         return self._send_get_request(req)
@@ -540,8 +786,6 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         해외 주식 잔고의 주문 가능 예수금을 반환한다. TODO 기능작성중
         """
-        is_kr = False
-        market_codes = Market.get_all()
         response = self._get_inquire_present_balance(extra_header, extra_param)
         datas = response.outputs[1]
 
@@ -565,20 +809,15 @@ class Api:  # pylint: disable=too-many-public-methods
             "INQR_DVSN_CD":"00"
         }
 
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
-
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(False)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
-            f"CTX_AREA_FK{query_code}": "",
-            f"CTX_AREA_NK{query_code}": ""
+            **self._account_params,
+            **_EMPTY_CTX_AREA_PARAMS[False],
+            **extra_param,
         }
 
-        params = merge_json([params, extra_param])
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         return self._send_get_request(req)
@@ -588,16 +827,14 @@ class Api:  # pylint: disable=too-many-public-methods
         해외 주식 주묵 내역을 DataFrame으로 반환한다
         return: 미국 주식 주문 내역을 DataFrame으로 반환
         """
-        datas = [self._get_os_order_history()]
-        return pd.concat(datas).drop_duplicates()
+        return self._get_os_order_history().drop_duplicates()
 
     def get_kr_order_history(self) -> pd.DataFrame:
         """
         국내 주식 주묵 내역을 DataFrame으로 반환한다
         return: 미국 주식 주문 내역을 DataFrame으로 반환
         """
-        datas = [self._get_kr_order_history()]
-        return pd.concat(datas).drop_duplicates()
+        return self._get_kr_order_history().drop_duplicates()
 
     def _get_os_order_history(self) -> pd.DataFrame:
         """
@@ -608,76 +845,9 @@ class Api:  # pylint: disable=too-many-public-methods
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
             tdf = pd.DataFrame(res.body['output'])
             if tdf.empty:
-                return tdf
-            cf1 = [
-                "ord_dt",
-                "ord_gno_brno",
-                "odno",
-                "orgn_odno",
-                "sll_buy_dvsn_cd",
-                "sll_buy_dvsn_cd_name",
-                "rvse_cncl_dvsn",
-                "rvse_cncl_dvsn_name",
-                "pdno",
-                "prdt_name",
-                "ft_ord_qty",
-                "ft_ord_unpr3",
-                "ft_ccld_qty",
-                "ft_ccld_unpr3",
-                "ft_ccld_amt3",
-                "nccs_qty",
-                "prcs_stat_name",
-                "rjct_rson",
-                "ord_tmd",
-                "tr_mket_name",
-                "tr_natn",
-                "tr_natn_name",
-                "ovrs_excg_cd",
-                "tr_crcy_cd",
-                "dmst_ord_dt",
-                "thco_ord_tmd",
-                "loan_type_cd",
-                "mdia_dvsn_name",
-                "loan_dt",
-                "rjct_rson_name",
-                "usa_amk_exts_rqst_yn"
-            ]
-
-            cf2 = [
-                "주문일자",
-                "주문채번지점번호",
-                "주문번호",
-                "원주문번호",
-                "매도매수구분코드",
-                "매도매수구분코드명",
-                "정정취소구분",
-                "정정취소구분명",
-                "상품번호",
-                "상품명",
-                "FT주문수량",
-                "FT주문단가3",
-                "FT체결수량",
-                "FT체결단가3",
-                "FT체결금액3",
-                "미체결수량",
-                "처리상태명",
-                "거부사유",
-                "주문시각",
-                "거래시장명",
-                "거래국가",
-                "거래국가명",
-                "해외거래소코드",
-                "거래통화코드",
-                "국내주문일자",
-                "당사주문시각",
-                "대출유형코드",
-                "매체구분명",
-                "대출일자",
-                "거부사유명",
-                "미국애프터마켓연장신청여부"
-            ]
-            ren_dict = dict(zip(cf1, cf2))
-            return tdf.rename(columns=ren_dict)
+                return pd.DataFrame()
+            tdf.rename(columns=_OS_ORDER_HISTORY_RENAME, inplace=True)
+            return to_arrow_backed(tdf)
 
         def request_function(*args, **kwargs):
             return self._get_order_history(is_kr=False, *args, **kwargs)
@@ -691,69 +861,13 @@ class Api:  # pylint: disable=too-many-public-methods
         """
 
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            tdf = pd.DataFrame(res.outputs[0])
+            tdf = pd.DataFrame.from_records(res.outputs[0],
+                                            columns=_KR_ORDER_HISTORY_COLUMNS)
             if tdf.empty:
-                return tdf
-
-            cf1 = [
-                "ord_dt",
-                "ord_gno_brno",
-                "odno",
-                "orgn_odno",
-                "ord_dvsn_name",
-                "sll_buy_dvsn_cd",
-                "sll_buy_dvsn_cd_name",
-                "pdno",
-                "prdt_name",
-                "ord_qty",
-                "ord_unpr",
-                "ord_tmd",
-                "tot_ccld_qty",
-                "avg_prvs",
-                "cncl_yn",
-                "tot_ccld_amt",
-                "loan_dt",
-                "ord_dvsn_cd",
-                "cncl_cfrm_qty",
-                "rmn_qty",
-                "rjct_qty",
-                "ccld_cndt_name",
-                "infm_tmd",
-                "ctac_tlno",
-                "prdt_type_cd",
-                "excg_dvsn_cd"
-            ]
-            cf2 = [
-                "주문일자",
-                "주문채번지점번호",
-                "주문번호",
-                "원주문번호",
-                "주문구분명",
-                "매도매수구분코드",
-                "매도매수구분코드명",
-                "상품번호",
-                "상품명",
-                "주문수량",
-                "주문단가",
-                "주문시각",
-                "총체결수량",
-                "평균가",
-                "취소여부",
-                "총체결금액",
-                "대출일자",
-                "주문구분코드",
-                "취소확인수량",
-                "잔여수량",
-                "거부수량",
-                "체결조건명",
-                "통보시각",
-                "연락전화번호",
-                "상품유형코드",
-                "거래소구분코드"
-            ]
-            tdf = tdf[cf1]
-            ren_dict = dict(zip(cf1, cf2))
-            return tdf.rename(columns=ren_dict)
+                return pd.DataFrame()
+
+            tdf.rename(columns=_KR_ORDER_HISTORY_RENAME, inplace=True)
+            return to_arrow_backed(tdf)
 
         def request_function(*args, **kwargs):
             return self._get_order_history(is_kr=True, *args, **kwargs)
@@ -790,19 +904,14 @@ class Api:  # pylint: disable=too-many-public-methods
             if not self.domain.is_real():
                 PDNO = ""
 
-        ORD_STRT_DT = (datetime.datetime.now() - datetime.timedelta(days=1)).strftime("%Y%m%d")
-        ORD_END_DT = datetime.datetime.now().strftime("%Y%m%d")
-
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
+        ORD_STRT_DT, ORD_END_DT = get_order_inquiry_period(datetime.date.today())
 
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(is_kr)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
 
         if is_kr:
             params = {
-                "CANO": self.account.account_code,
-                "ACNT_PRDT_CD": self.account.product_code,
+                **self._account_params,
                 "INQR_STRT_DT": ORD_STRT_DT,
                 "INQR_END_DT": ORD_END_DT,
                 "SLL_BUY_DVSN_CD": sell_or_buy,
@@ -813,13 +922,10 @@ class Api:  # pylint: disable=too-many-public-methods
                 "ODNO": "",
                 "INQR_DVSN_3": "00",
                 "INQR_DVSN_1": "",
-                f"CTX_AREA_FK{query_code}": "",
-                f"CTX_AREA_NK{query_code}": ""
             }
         else:
             params = {
-                "CANO": self.account.account_code,
-                "ACNT_PRDT_CD": self.account.product_code,
+                **self._account_params,
                 "PDNO": PDNO,
                 "ORD_STRT_DT": ORD_STRT_DT,
                 "ORD_END_DT": ORD_END_DT,
@@ -830,11 +936,9 @@ class Api:  # pylint: disable=too-many-public-methods
                 "ORD_DT": "",
                 "ORD_GNO_BRNO": "",
                 "ODNO": "",
-                f"CTX_AREA_FK{query_code}": "",
-                f"CTX_AREA_NK{query_code}": ""
             }
 
-        params = merge_json([params, extra_param])
+        params = {**params, **_EMPTY_CTX_AREA_PARAMS[is_kr], **extra_param}
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         return self._send_get_request(req)
@@ -852,22 +956,17 @@ class Api:  # pylint: disable=too-many-public-methods
         url_path = "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl"
         tr_id = "TTTC8036R"
 
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
-
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(True)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
-            f"CTX_AREA_FK{query_code}": "",
-            f"CTX_AREA_NK{query_code}": "",
+            **self._account_params,
+            **_EMPTY_CTX_AREA_PARAMS[True],
             "INQR_DVSN_1": "0",
-            "INQR_DVSN_2": "0"
+            "INQR_DVSN_2": "0",
+            **extra_param,
         }
 
-        params = merge_json([params, extra_param])
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         res = self._send_get_request(req)
@@ -886,23 +985,18 @@ class Api:  # pylint: disable=too-many-public-methods
         else:
             tr_id = "VTTT3018R"
 
-        extra_header = none_to_empty_dict(extra_header)
-        extra_param = none_to_empty_dict(extra_param)
+        extra_header = {"tr_cont": "", **(extra_header or {})}
+        extra_param = extra_param or {}
         markert_code = self.market_code_map.to_4(markert_code)
 
-        extra_header = merge_json([{"tr_cont": ""}, extra_header])
-        query_code = get_continuous_query_code(False)
-
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
-            f"CTX_AREA_FK{query_code}": "",
-            f"CTX_AREA_NK{query_code}": "",
+            **self._account_params,
+            **_EMPTY_CTX_AREA_PARAMS[False],
             "OVRS_EXCG_CD": markert_code,
             "SORT_SQN": "DS",
+            **extra_param,
         }
 
-        params = merge_json([params, extra_param])
         req = APIRequestParameter(url_path, tr_id, params,
                                   extra_header=extra_header)
         res = self._send_get_request(req)
@@ -913,29 +1007,20 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         취소/정정 가능한 국내 주식 주문 목록을 DataFrame으로 반환한다.
         """
-        def sell_or_buy(value):  # 01: 매도, 02: 매수
-            return "매도" if value == "01" else "매수"
-
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            data = pd.DataFrame(res.outputs[0])
+            data = pd.DataFrame.from_records(res.outputs[0],
+                                             columns=["odno"] + _KR_ORDERS_COLUMNS)
             if data.empty:
-                return data
+                return pd.DataFrame()
 
             data.set_index("odno", inplace=True)
-            keys = ["pdno", "ord_qty", "psbl_qty", "ord_unpr", "sll_buy_dvsn_cd",
-                    "ord_tmd", "ord_gno_brno", "orgn_odno"]
-            values = ["종목코드", "주문수량", "정정취소가능수량",
-                      "주문가격", "매수매도구분", "시간", "주문점", "원번호"]
-            data = data[keys]
             sell_or_buy_column = "sll_buy_dvsn_cd"
 
-            data[sell_or_buy_column] = data[sell_or_buy_column].apply(
-                sell_or_buy)
+            data = coerce_numeric(data, _KR_ORDERS_DTYPES)
+            data[sell_or_buy_column] = data[sell_or_buy_column].map(_SELL_BUY_MAP) \
+                .astype(_SELL_BUY_DTYPE)
 
-            rename_map = dict(zip(keys, values))
-            data = data.rename(columns=rename_map)
-
-            return data
+            return select_and_rename(data, _KR_ORDERS_RENAME)
 
         return send_continuous_query(self._get_kr_orders_once, to_dataframe)
 
@@ -943,47 +1028,7 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         미체결 해외 주식 주문 목록을 DataFrame으로 반환한다.
         """
-        def sell_or_buy(value):  # 01: 매도, 02: 매수
-            return "매도" if value == "01" else "매수"
-
-        def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            data = pd.DataFrame(res.outputs[0])
-            if data.empty:
-                return data
-
-            sell_or_buy_column = "sll_buy_dvsn_cd"
-            market_code_column = "ovrs_excg_cd"
-
-            data.set_index("odno", inplace=True)
-
-            rename_map = {
-                "pdno": "종목코드",
-                "ft_ord_qty": "주문수량",
-                "ft_ccld_qty": "체결수량",
-                "nccs_qty": "미체결수량",
-                "ft_ord_unpr3": "주문가격",
-                sell_or_buy_column: "매수매도구분",
-                "ord_tmd": "시간",
-                "ord_gno_brno": "주문점",
-                "orgn_odno": "원번호",
-                market_code_column: "해외거래소코드",
-                "tr_crcy_cd": "거래통화코드",
-                "prcs_stat_name": "처리상태명",
-                "rjct_rson_name": "거부사유명",
-                "rjct_rson": "거부사유",
-            }
-
-            data = data[rename_map.keys()]
-
-            data[sell_or_buy_column] = data[sell_or_buy_column].apply(sell_or_buy)
-
-            data[market_code_column] = data[market_code_column].apply(
-                self.market_code_map.to_4
-            )
-
-            data = data.rename(columns=rename_map)
-
-            return data
+        return self.get_os_orders_by_flag()
 
     def get_os_buy_orders(self):
         return self.get_os_orders_by_flag("매수")
@@ -993,66 +1038,53 @@ class Api:  # pylint: disable=too-many-public-methods
 
     def get_os_orders_by_flag(self, sell_or_buy=None) -> pd.DataFrame:
         """
-        미체결 해외 주식 매수 주문 목록을 DataFrame으로 반환한다.
+        미체결 해외 주식 주문 목록을 DataFrame으로 반환한다.
+        sell_or_buy: 조회할 주문 구분 ("매수" 또는 "매도"). 지정하지 않은 경우 전부 조회.
         """
-        def sell_or_buy(value):  # 01: 매도, 02: 매수
-            return "매도" if value == "01" else "매수"
+        if sell_or_buy and sell_or_buy not in _SELL_BUY_CODES:
+            raise RuntimeError(f"invalid sell_or_buy: {sell_or_buy} (매수/매도 중 하나를 입력해주세요)")
+
+        sell_or_buy_code = _SELL_BUY_CODES[sell_or_buy] if sell_or_buy else None
 
         def to_dataframe(res: APIResponse) -> pd.DataFrame:
-            data = pd.DataFrame(res.outputs[0])
+            data = pd.DataFrame.from_records(res.outputs[0],
+                                             columns=["odno"] + _OS_ORDERS_COLUMNS)
             if data.empty:
-                return data
+                return pd.DataFrame()
 
             sell_or_buy_column = "sll_buy_dvsn_cd"
             market_code_column = "ovrs_excg_cd"
 
             data.set_index("odno", inplace=True)
 
-            rename_map = {
-                "pdno": "종목코드",
-                "ft_ord_qty": "주문수량",
-                "ft_ccld_qty": "체결수량",
-                "nccs_qty": "미체결수량",
-                "ft_ord_unpr3": "주문가격",
-                sell_or_buy_column: "매수매도구분",
-                "ord_tmd": "시간",
-                "ord_gno_brno": "주문점",
-                "orgn_odno": "원번호",
-                market_code_column: "해외거래소코드",
-                "tr_crcy_cd": "거래통화코드",
-                "prcs_stat_name": "처리상태명",
-                "rjct_rson_name": "거부사유명",
-                "rjct_rson": "거부사유",
-            }
+            # 변환 작업 전에 원본 코드 기준으로 먼저 걸러낸다
+            if sell_or_buy_code is not None:
+                data = data[data[sell_or_buy_column] == sell_or_buy_code]
 
-            data = data[rename_map.keys()]
+            data = coerce_numeric(data, _OS_ORDERS_DTYPES)
+            data[sell_or_buy_column] = data[sell_or_buy_column].map(_SELL_BUY_MAP) \
+                .astype(_SELL_BUY_DTYPE)
 
-            data[sell_or_buy_column] = data[sell_or_buy_column].apply(
-                sell_or_buy)
+            market_codes = data[market_code_column]
+            data[market_code_column] = market_codes.map(
+                self.market_code_map.map_any_to_4
+            ).fillna(market_codes)
 
-            data[market_code_column] = data[market_code_column].apply(
-                self.market_code_map.to_4
-            )
+            return select_and_rename(data, _OS_ORDERS_RENAME)
 
-            if sell_or_buy:
-                data = data[data[sell_or_buy_column] == sell_or_buy]
+        def query_market(code: str) -> pd.DataFrame:
+            return send_continuous_query(functools.partial(self._get_os_orders_once, code),
+                                         to_dataframe, is_kr=False)
 
-            data = data.rename(columns=rename_map)
+        market_codes = [code for code in self.market_code_map.codes_4
+                        if code not in _EXCLUDED_OS_CODES]
+        outputs = map_concurrently(query_market, market_codes)
 
+        data = pd.concat(outputs)
+        if data.empty:
             return data
 
-        def request_function_factory(code: str):
-            def request_function(*args, **kwargs):
-                return self._get_os_orders_once(code, *args, **kwargs)
-
-            return request_function
-
-        outputs = [
-            send_continuous_query(request_function_factory(code), to_dataframe)
-            for code in self.market_code_map.codes_4 if code not in ["AMEX", "NYSE"]
-        ]
-
-        return pd.concat(outputs)
+        return data.astype(_OS_ORDERS_CATEGORIES)
 
     # 주문 조회------------
 
@@ -1074,12 +1106,11 @@ class Api:  # pylint: disable=too-many-public-methods
             tr_id = "TTTC0801U"  # sell
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
+            **self._account_params,
             "PDNO": ticker,
             "ORD_DVSN": order_type,
-            "ORD_QTY": str(amount),
-            "ORD_UNPR": str(price),
+            "ORD_QTY": f"{amount}",
+            "ORD_UNPR": f"{price}",
             "CTAC_TLNO": "",
             # "SLL_TYPE": "01",
             # "ALGO_NO": ""
@@ -1115,23 +1146,24 @@ class Api:  # pylint: disable=too-many-public-methods
         해외 주식 매매
         """
         order_type = "00"  # 00: 지정가, 01: 시장가, ...
-        price_as_str = f"{price:.2f}"
-        market_code = self.market_code_map.to_4(market_code)
-
         if price <= 0:
             raise RuntimeError("[Error] 해외 주식 매매에서는 시장가를 지원하지 않습니다")
 
+        price_as_str = f"{price:.2f}"
+        market_code = self.market_code_map.to_4(market_code)
+
         url_path = "/uapi/overseas-stock/v1/trading/order"
 
-        tr_id = get_order_tr_id_from_market_code(market_code, buy, self.domain.is_real())
+        tr_id = self._os_order_tr_ids.get((market_code, buy))
+        if tr_id is None:
+            raise RuntimeError(f"invalid market code: {market_code}")
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
+            **self._account_params,
             "PDNO": ticker,
             "OVRS_EXCG_CD": market_code,
             "ORD_DVSN": order_type,
-            "ORD_QTY": str(order_amount),
+            "ORD_QTY": f"{order_amount}",
             "OVRS_ORD_UNPR": price_as_str,
             "ORD_SVR_DVSN_CD": "0",
         }
@@ -1185,30 +1217,9 @@ class Api:  # pylint: disable=too-many-public-methods
         is_cancel: 정정구분(취소-True, 정정-False)
         return: 서버 response
         """
-        tr = {
-            "real": {
-                "USA": "TTTT1004U",
-                "HK": "TTTS1003U",
-                "JP": "TTTS0309U",
-                "CN_SHA": "TTTS0302U",
-                "CN_SZX": "TTTS0306U",
-                "VN": "TTTS0312U",
-            },
-            "virtual": {
-                "USA": "VTTT1004U",
-                "HK": "VTTS1003U",
-                "JP": "VTTS0309U",
-                "CN_SHA": "VTTS0302U",
-                "CN_SZX": "VTTS0306U",
-                "VN": "VTTS0312U",
-            }
-        }
         url_path = "/uapi/overseas-stock/v1/trading/order-rvsecncl"
-        if self.domain.is_real():
-            tr_id = tr["real"][get_country_by_market_code(market_code)]
-        else:
-            tr_id = tr["virtual"][get_country_by_market_code(market_code)]
-
+        country = get_country_by_market_code(market_code)
+        tr_id = _OS_REVISE_CANCEL_TR_IDS[(self._is_real, country)]
 
         cancel_dv: str = "02" if is_cancel else "01"
         price: float = 0 if is_cancel else price
@@ -1217,14 +1228,13 @@ class Api:  # pylint: disable=too-many-public-methods
             amount = 1
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
+            **self._account_params,
             "OVRS_EXCG_CD": market_code,
             "PDNO": ticker,
             "ORGN_ODNO": order_number,
             "RVSE_CNCL_DVSN_CD": cancel_dv,
-            "ORD_QTY": str(amount),
-            "OVRS_ORD_UNPR": str(price),
+            "ORD_QTY": f"{amount}",
+            "OVRS_ORD_UNPR": f"{price}",
         }
 
         req = APIRequestParameter(url_path, tr_id=tr_id,
@@ -1263,26 +1273,20 @@ class Api:  # pylint: disable=too-many-public-methods
         return: 서버 response list.
         """
         data = self.get_os_orders()
-        orders = data.index.to_list()
-        tickers = data["pdno"].to_list()
-        markets = data["ovrs_excg_cd"].to_list()
-        amounts = data["nccs_qty"].to_list()
-        delay = 0.2  # sec
+        if data.empty:
+            return []
 
-        rets = []
-
-        for order, ticker, amount, market_code in zip(orders, tickers, amounts, markets):
-            rets.append(
-                self.cancel_os_order(
-                    order_number=order,
-                    ticker=ticker,
-                    amount=amount,
-                    market_code=market_code
-                )
+        def cancel(order_info: Tuple[str, str, int, str]) -> Json:
+            order, ticker, amount, market_code = order_info
+            return self.cancel_os_order(
+                order_number=order,
+                ticker=ticker,
+                amount=amount,
+                market_code=market_code
             )
-            time.sleep(delay)
 
-        return rets
+        order_infos = data[["종목코드", "미체결수량", "해외거래소코드"]].itertuples(name=None)
+        return map_concurrently(cancel, order_infos, max_workers=ORDER_MAX_WORKERS)
 
     def revise_os_order(
             self,
@@ -1336,29 +1340,23 @@ class Api:  # pylint: disable=too-many-public-methods
             amount=amount,
         )
 
-    def revise_os_order_by_current_price(self, order_id) -> [Json]:
+    def revise_os_order_id_by_current_price(self, order_id: str) -> Optional[Json]:
         """
-        특정 해외 주식 주문의 가격을 현재가로 정정한다.
-        return: 서버 response.
+        주문 번호에 해당하는 해외 주식 주문의 가격을 현재가로 정정한다.
+        order_id: 주문 번호.
+        return: 서버 response. 미체결 주문 목록에 없는 경우 None.
         """
-        # 먼저 미체결 목록들을 불러온다
         data = self.get_os_orders()
+        if order_id not in data.index:
+            return None
 
-        # 해당 order_id와 일치하는 주문이 있는지 확인한다
-        order = data[data["orgn_odno"] == order_id]
-        ret = None
-        if order and not order.empty():
-            code = order["종목코드"]
-            market_code = order["해외거래소코드"]
-            amount = order["미체결수량"]
-            ret = self.revise_os_order_by_current_price(
-                order_number=order,
-                ticker=ticker,
-                amount=amount,
-                market_code=market_code
-            )
-
-        return ret
+        order = data.loc[order_id]
+        return self.revise_os_order_by_current_price(
+            order_number=order_id,
+            ticker=order["종목코드"],
+            market_code=order["해외거래소코드"],
+            amount=order["미체결수량"],
+        )
 
     def revise_all_os_order_by_current_price(self) -> [Json]:
         """
@@ -1366,27 +1364,7 @@ class Api:  # pylint: disable=too-many-public-methods
         return: 서버 response list.
         """
         data = self.get_os_orders_by_flag()
-        orders = data.index.to_list()
-        rets = []
-        if not data.empty:
-            tickers = data["종목코드"].to_list()
-            markets = data["해외거래소코드"].to_list()
-            amounts = data["미체결수량"].to_list()
-            delay = 0.3  # sec
-
-            for order, ticker, amount, market_code in zip(orders, tickers, amounts, markets):
-                try:
-                    ret = self.revise_os_order_by_current_price(
-                        order_number=order,
-                        ticker=ticker,
-                        amount=amount,
-                        market_code=market_code
-                    )
-                    rets.append(ret)
-                except Exception as e:
-                    print(e)
-                time.sleep(delay)
-        return rets
+        return self._revise_os_orders_by_current_price(data)
 
     def revise_all_os_buy_order_by_current_price(self) -> [Json]:
         """
@@ -1394,27 +1372,55 @@ class Api:  # pylint: disable=too-many-public-methods
         return: 서버 response list.
         """
         data = self.get_os_buy_orders()
-        orders = data.index.to_list()
-        rets = []
-        if not data.empty:
-            tickers = data["종목코드"].to_list()
-            markets = data["해외거래소코드"].to_list()
-            amounts = data["미체결수량"].to_list()
-            delay = 0.3  # sec
-
-            for order, ticker, amount, market_code in zip(orders, tickers, amounts, markets):
-                try:
-                    ret = self.revise_os_order_by_current_price(
-                        order_number=order,
-                        ticker=ticker,
-                        amount=amount,
-                        market_code=market_code
-                    )
-                    rets.append(ret)
-                except Exception as e:
-                    print(e)
-                time.sleep(delay)
-        return rets
+        return self._revise_os_orders_by_current_price(data)
+
+    def _revise_os_orders_by_current_price(self, data: pd.DataFrame) -> [Json]:
+        """
+        DataFrame으로 주어진 해외 주식 주문들의 가격을 현재가로 정정한다.
+        정정에 실패한 주문은 건너뛴다.
+        return: 정정에 성공한 주문들의 서버 response list.
+        """
+        if data.empty:
+            return []
+
+        # 같은 종목의 주문이 여러 개인 경우에도 현재가는 한 번만 조회한다
+        price_keys = list(dict.fromkeys(
+            data[["종목코드", "해외거래소코드"]].itertuples(index=False, name=None)
+        ))
+
+        def fetch_price(price_key: Tuple[str, str]) -> Optional[float]:
+            ticker, market_code = price_key
+            try:
+                return self.get_os_current_price(ticker=ticker,
+                                                 market_code=self.market_code_map.to_3(market_code))
+            except Exception as e:  # pylint: disable=broad-except
+                print(e)
+                return None
+
+        prices = dict(zip(price_keys, map_concurrently(fetch_price, price_keys)))
+
+        def revise(order_info: Tuple[str, str, int, str]) -> Optional[Json]:
+            order, ticker, amount, market_code = order_info
+            price = prices[(ticker, market_code)]
+            if price is None:
+                return None
+
+            try:
+                return self._revise_cancel_os_orders(
+                    order_number=order,
+                    ticker=ticker,
+                    market_code=market_code,
+                    is_cancel=False,
+                    price=price,
+                    amount=amount,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                print(e)
+                return None
+
+        order_infos = data[["종목코드", "미체결수량", "해외거래소코드"]].itertuples(name=None)
+        rets = map_concurrently(revise, order_infos, max_workers=ORDER_MAX_WORKERS)
+        return [ret for ret in rets if ret is not None]
 
     def _revise_cancel_kr_orders(self,  # pylint: disable=too-many-arguments
                                  order_number: str,
@@ -1445,14 +1451,13 @@ class Api:  # pylint: disable=too-many-public-methods
             amount = 1
 
         params = {
-            "CANO": self.account.account_code,
-            "ACNT_PRDT_CD": self.account.product_code,
+            **self._account_params,
             "KRX_FWDG_ORD_ORGNO": order_branch,
             "ORGN_ODNO": order_number,
             "ORD_DVSN": order_dv,
             "RVSE_CNCL_DVSN_CD": cancel_dv,
-            "ORD_QTY": str(amount),
-            "ORD_UNPR": str(price),
+            "ORD_QTY": f"{amount}",
+            "ORD_UNPR": f"{price}",
             "QTY_ALL_ORD_YN": apply_all
         }
 
@@ -1482,13 +1487,15 @@ class Api:  # pylint: disable=too-many-public-methods
         미체결된 모든 국내 주식 주문들을 취소한다.
         """
         data = self.get_kr_orders()
-        orders = data.index.to_list()
-        branchs = data["주문점"].to_list()
-        delay = 0.2  # sec
+        if data.empty:
+            return
+
+        def cancel(order_info: Tuple[str, str]) -> Json:
+            order, branch = order_info
+            return self.cancel_kr_order(order, order_branch=branch)
 
-        for order, branch in zip(orders, branchs):
-            self.cancel_kr_order(order, order_branch=branch)
-            time.sleep(delay)
+        map_concurrently(cancel, data[["주문점"]].itertuples(name=None),
+                         max_workers=ORDER_MAX_WORKERS)
 
     def revise_kr_order(self, order_number: str,
                         price: int,
@@ -1517,7 +1524,9 @@ class Api:  # pylint: disable=too-many-public-methods
         """
         url = self.domain.get_url(req.url_path)
         headers = self._parse_headers(req)
-        return send_get_request(url, headers, req.params, raise_flag=raise_flag)
+        self.rate_limiter.acquire()
+        return send_get_request(url, headers, req.params, raise_flag=raise_flag,
+                                session=self.session)
 
     def _send_post_request(self, req: APIRequestParameter, raise_flag: bool = True) -> APIResponse:
         """
@@ -1528,35 +1537,31 @@ class Api:  # pylint: disable=too-many-public-methods
 
         if req.requires_hash:
             self.set_hash_key(headers, req.params)
-        return send_post_request(url, headers, req.params, raise_flag=raise_flag)
+        self.rate_limiter.acquire()
+        return send_post_request(url, headers, req.params, raise_flag=raise_flag,
+                                 session=self.session)
 
     def _parse_headers(self, req: APIRequestParameter) -> Tuple[str, Json]:
         """
         API에 request에 필요한 header를 구해서 튜플로 반환한다.
         """
 
-        headers = [
-            get_base_headers(),
-            self.get_api_key_data(),
-        ]
+        headers = dict(self._static_headers)
 
         tr_id = self.domain.adjust_tr_id(req.tr_id)
 
         if tr_id is not None:
-            headers.append({"tr_id": tr_id})
+            headers["tr_id"] = tr_id
 
         if req.requires_authentication:
-            if self.need_authentication():
-                self.create_token()
-
-            headers.append({
-                "authorization": self.token.value,
-            })
+            # 여러 thread에서 동시에 token을 중복 발급하지 않도록 한다
+            with self._token_lock:
+                if self.need_authentication():
+                    self.create_token()
 
-        extra_header = none_to_empty_dict(req.extra_header)
-        headers.append(extra_header)
+            headers["authorization"] = self.token.value
 
-        headers = merge_json(headers)
+        headers.update(req.extra_header or {})
 
         return headers
 
@@ -119,11 +119,14 @@ def get_base_headers() -> Json:
     return base
 
 
-def send_get_request(url: str, headers: Json, params: Json, raise_flag: bool = True) -> APIResponse:
+def send_get_request(url: str, headers: Json, params: Json, raise_flag: bool = True,
+                     session: Optional[requests.Session] = None) -> APIResponse:
     """
     HTTP GET method로 request를 보내고 APIResponse 객체를 반환한다.
+    session이 주어진 경우 해당 session의 connection을 재사용한다.
     """
-    resp = requests.get(url, headers=headers, params=params, timeout=30)
+    sender = session if session is not None else requests
+    resp = sender.get(url, headers=headers, params=params, timeout=30)
     api_resp = APIResponse(resp)
 
     if raise_flag:
@@ -133,12 +136,15 @@ def send_get_request(url: str, headers: Json, params: Json, raise_flag: bool = T
 
 
 def send_post_request(url: str, headers: Json, params: Json,
-                      raise_flag: bool = True) -> APIResponse:
+                      raise_flag: bool = True,
+                      session: Optional[requests.Session] = None) -> APIResponse:
     """
     HTTP POST method로 request를 보내고 APIResponse 객체를 반환한다.
+    session이 주어진 경우 해당 session의 connection을 재사용한다.
     """
-    resp = requests.post(url, headers=headers,
-                         data=json.dumps(params), timeout=30)
+    sender = session if session is not None else requests
+    resp = sender.post(url, headers=headers,
+                       data=json.dumps(params), timeout=30)
     api_resp = APIResponse(resp)
 
     if raise_flag:
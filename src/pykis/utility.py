@@ -16,13 +16,22 @@ pykis의 각종 유틸리티들을 모아둔 모듈
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Iterable, Optional, NamedTuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, NamedTuple, Tuple
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import functools
+import importlib.util
+import threading
 import pandas as pd
 from .request_utility import Json, APIResponse
 import time
 
-DELAY = 0.2
+MAX_WORKERS = 16
+
+# pandas 2.0 이상이고 pyarrow가 설치된 경우에만 Arrow 기반 dtype을 사용한다
+ARROW_BACKEND_AVAILABLE = int(pd.__version__.split(".", maxsplit=1)[0]) >= 2 and \
+    importlib.util.find_spec("pyarrow") is not None
 
 def get_order_tr_id_from_market_code(market_code: str, is_buy: bool, is_real: bool) -> str:
     """
@@ -83,12 +92,23 @@ def get_continuous_query_code(is_kr: bool) -> str:
     return "100" if is_kr else "200"
 
 
+@functools.lru_cache(maxsize=1)
+def get_order_inquiry_period(today: date) -> Tuple[str, str]:
+    """
+    주문 내역 조회 기간(전일 ~ 당일)을 YYYYMMDD 형식의 문자열 tuple로 반환한다.
+    날짜가 바뀌기 전까지는 이전에 계산한 결과를 재사용한다.
+    """
+    yesterday = today - timedelta(days=1)
+    return f"{yesterday:%Y%m%d}", f"{today:%Y%m%d}"
+
+
 def send_continuous_query(request_function: Callable[[Json, Json], APIResponse],
                           to_dataframe:
                           Callable[[APIResponse], pd.DataFrame],
                           is_kr: bool = True) -> pd.DataFrame:
     """
     조회 결과가 100건 이상 존재하는 경우 연속하여 query 후 전체 결과를 DataFrame으로 통합하여 반환한다.
+    호출 간격 제한은 request_function 쪽(ex> Api의 rate limiter)에서 처리해야 한다.
     """
     max_count = 100
     outputs = []
@@ -96,7 +116,6 @@ def send_continuous_query(request_function: Callable[[Json, Json], APIResponse],
     extra_header = {}
     extra_param = {}
     for i in range(max_count):
-        time.sleep(DELAY)
         if i > 0:
             extra_header = {"tr_cont": "N"}    # 공백 : 초기 조회, N : 다음 데이터 조회
         res = request_function(
@@ -127,6 +146,25 @@ def merge_json(datas: Iterable[Json]) -> Json:
     return ret
 
 
+def select_and_rename(data: pd.DataFrame, rename_map: Dict[str, str]) -> pd.DataFrame:
+    """
+    rename_map의 key에 해당하는 컬럼만 골라서 value로 이름을 바꾼 DataFrame을 한 번에 생성한다.
+    """
+    return pd.DataFrame({new: data[old].values for old, new in rename_map.items()},
+                        index=data.index)
+
+
+def coerce_numeric(data: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    dtypes의 key에 해당하는 컬럼들을 숫자로 변환한 DataFrame을 반환한다.
+    숫자로 변환할 수 없는 값(빈 문자열 등)은 결측값이 된다.
+    """
+    return data.assign(**{
+        column: pd.to_numeric(data[column], errors="coerce").astype(dtype)
+        for column, dtype in dtypes.items()
+    })
+
+
 def to_namedtuple(name: str, json_data: Json) -> NamedTuple:
     """
     json 형식의 데이터를 NamedTuple 타입으로 반환한다.
@@ -140,3 +178,101 @@ def none_to_empty_dict(data: Optional[Json]) -> Json:
     입력 값이 None인 경우에 빈 dictionary를 반환한다.
     """
     return data if data is not None else {}
+
+
+def map_concurrently(function: Callable[[Any], Any], items: Iterable[Any],
+                     max_workers: int = MAX_WORKERS) -> List[Any]:
+    """
+    items의 각 원소에 function을 thread pool에서 동시에 적용한다.
+    결과는 입력 순서대로 list로 반환한다.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+class RateLimiter:
+    """
+    초당 요청 횟수를 제한하는 token bucket 방식의 rate limiter.
+    여러 thread에서 하나의 객체를 공유해서 사용할 수 있다.
+    """
+
+    def __init__(self, calls_per_second: float, burst: int = 1) -> None:
+        """
+        calls_per_second: 초당 허용되는 요청 횟수
+        burst: 대기 없이 연속으로 보낼 수 있는 최대 요청 횟수
+        """
+        self.interval: float = 1 / calls_per_second
+        self.burst: int = burst
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        요청을 보낼 수 있을 때까지 대기한다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            refilled = (now - self._updated_at) / self.interval
+            self._tokens = min(self.burst, self._tokens + refilled)
+            self._updated_at = now
+            wait = max(0.0, (1 - self._tokens) * self.interval)
+            self._tokens -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class TTLCache:
+    """
+    일정 시간(ttl) 동안만 값을 보관하는 간단한 cache.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        ttl: 값을 보관할 시간 (단위: 초). 0 이하인 경우 값을 보관하지 않는다.
+        """
+        self.ttl: float = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        key에 해당하는 값을 반환한다. 값이 없거나 만료된 경우 None을 반환한다.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        stored_at, value = item
+        if time.monotonic() - stored_at >= self.ttl:
+            self._data.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        key에 해당하는 값을 저장한다.
+        """
+        if self.ttl > 0:
+            self._data[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """
+        저장된 모든 값을 삭제한다.
+        """
+        self._data.clear()
+
+
+def to_arrow_backed(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    가능한 경우 DataFrame의 컬럼들을 Arrow 기반 dtype으로 변환하여 반환한다.
+    Arrow 기반 dtype을 사용할 수 없는 환경에서는 입력을 그대로 반환한다.
+    """
+    if not ARROW_BACKEND_AVAILABLE:
+        return data
+    return data.convert_dtypes(dtype_backend="pyarrow")